@@ -1,41 +1,309 @@
 #!/usr/bin/env python3
 """
-Better PDF to Markdown converter that preserves original structure
+PDF to Markdown converter for the ADR documents
+
+Two conversion modes are supported:
+- structured: format the extracted text as markdown line by line
+- preserve: extract the text with page breaks and emit the hand-structured template
 """
 
-import pdfplumber
+import argparse
+import os
+import pymupdf
 import re
 import sys
-import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Precompiled patterns used while structuring and formatting lines
+_SECTION_RE = re.compile(r'^(\d+)\.\s*(.+)')
+_SUBSECTION_RE = re.compile(r'^(\d+\.\d+)\.\s*(.+)')
+_TECH_LABEL_RE = re.compile(r'^[A-Z][a-zA-Z\s]+:$')
+_NUM_LIST_RE = re.compile(r'^\d+\.\s+')
+_ALPHA_LIST_RE = re.compile(r'^[a-z]\.\s+')
+# Sequence diagram markers: one pattern to open a diagram block, one to continue it
+_SEQ_START_RE = re.compile(r'sequenceDiagram|->|^\d+\s+(?:participant|alt|else|end)')
+_SEQ_LINE_RE = re.compile(r'->|Note over|^\d+\s+(?:participant|alt|else|end)')
+_WS_COLLAPSE_RE = re.compile(r'\n{3,}')
+
+# Line prefixes that should be rendered as headers
+_HEADER_KEYWORDS = (
+    "Current Challenges & Requirements:", "Goals:", "Use Cases:", "Narrative:",
+    "Key Components of the Decision:", "Pros:", "Cons:", "Risks & Mitigations:",
+    "Overall Solution:", "QR Code Authentication:", "OTP to mPass App Authentication:",
+    "Human-Friendly Identifiers:", "Tier and Billing Management Security:",
+    "Open Issues / Next Steps", "Story Definition"
+)
+
+# Header keywords bucketed by first character, so a line is only compared
+# against the keywords that could match it
+_HEADER_BY_FIRST = {
+    c: tuple(k for k in _HEADER_KEYWORDS if k[0] == c)
+    for c in {k[0] for k in _HEADER_KEYWORDS}
+}
+
+# Supported conversion modes
+MODES = ("structured", "preserve")
+
+# Text appended after each extracted page, per conversion mode
+_PAGE_SEPARATORS = {
+    "structured": "\n\n",
+    "preserve": "\n\n--- PAGE BREAK ---\n\n",
+}
+
+# Document handle opened once per worker process by _init_worker
+_worker_pdf = None
+
+# Documents shorter than this are extracted serially, since starting worker
+# processes would cost more than decoding the pages
+_PARALLEL_MIN_PAGES = 32
+
+# Report extraction progress every this many pages
+_PROGRESS_INTERVAL = 50
+
+def _init_worker(pdf_path):
+    """Open the PDF once for the lifetime of a worker process"""
+    
+    global _worker_pdf
+    _worker_pdf = pymupdf.open(pdf_path)
 
-def extract_text_preserve_structure(pdf_path):
-    """Extract text from PDF preserving the original structure"""
+def _page_text(page):
+    """Extract the text of a single page"""
     
-    try:
-        with pdfplumber.open(pdf_path) as pdf:
-            print(f"Processing {len(pdf.pages)} pages...")
+    # PDF pages without fonts (e.g. scanned images) cannot contain text, and
+    # checking the resources is far cheaper than interpreting the page.
+    # get_fonts() is empty for every non-PDF document, so only gate PDFs.
+    if page.parent.is_pdf and not page.get_fonts():
+        return ""
+    
+    return page.get_text("text")
+
+def _extract_page(page_index):
+    """Extract the text of a single page (runs in a worker process)"""
+    
+    return page_index, _page_text(_worker_pdf[page_index])
+
+def _page_texts(pdf_path, pdf):
+    """Yield (page index, text) for every page of an open document, in page order"""
+    
+    page_count = pdf.page_count
+    
+    if page_count < _PARALLEL_MIN_PAGES:
+        for i, page in enumerate(pdf):
+            yield i, _page_text(page)
+        return
+    
+    # Pages are decoded independently, so spread them across processes.
+    # executor.map yields results in page order.
+    workers = min(page_count, os.cpu_count() or 1)
+    chunksize = max(1, page_count // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(pdf_path,)) as executor:
+        yield from executor.map(_extract_page, range(page_count), chunksize=chunksize)
+
+def _report_progress(done, total):
+    """Refresh the page progress counter on stderr"""
+    
+    if done % _PROGRESS_INTERVAL == 0 or done == total:
+        sys.stderr.write(f"\rExtracted {done}/{total} pages")
+        if done == total:
+            sys.stderr.write("\n")
+
+def extract(pdf_path, page_sep):
+    """Extract text from PDF, appending page_sep after every page with text"""
+    
+    text_parts = []
+    
+    # Errors opening the file propagate so the caller can report them
+    with pymupdf.open(pdf_path) as pdf:
+        page_count = pdf.page_count
+        
+        try:
+            print(f"Processing {page_count} pages...")
             
-            full_text = ""
-            for i, page in enumerate(pdf.pages):
-                print(f"Processing page {i+1}...")
+            for i, page_text in _page_texts(pdf_path, pdf):
+                _report_progress(i + 1, page_count)
                 
-                # Extract text from the page
-                page_text = page.extract_text()
                 if page_text:
-                    # Add page break marker
-                    full_text += page_text + "\n\n--- PAGE BREAK ---\n\n"
+                    text_parts.append(page_text)
+                    text_parts.append(page_sep)
+        
+        except Exception as e:
+            print(f"Error extracting text: {e}")
+            return ""
+    
+    return "".join(text_parts)
+
+def clean_and_structure_text(text):
+    """Clean and structure the extracted text properly"""
+    
+    structured_lines = []
+    
+    # Single pass over all lines; blank lines between paragraphs are dropped.
+    # Split on '\n' only: splitlines() would also break on \r, \x0c, \u2028 etc.
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        
+        # Remove page numbers
+        if line.isdecimal():
+            continue
             
-            return full_text
+        structured_lines.append(line)
     
-    except Exception as e:
-        print(f"Error extracting text: {e}")
-        return ""
+    return structured_lines
+
+def format_as_proper_markdown(lines):
+    """Convert lines to properly formatted markdown"""
+    
+    markdown_content = []
+    markdown_content.append("# ADR-015: Moneta Network Authentication and Identification")
+    markdown_content.append("")
+    
+    i = 0
+    while i < len(lines):
+        # clean_and_structure_text only emits stripped, non-empty lines
+        line = lines[i]
+        
+        # Skip the first few title repetitions
+        if "ADR-015" in line and "Moneta Network Authentication" in line:
+            i += 1
+            continue
+            
+        # Dispatch on the first character so each line only runs the checks
+        # that can possibly match it
+        first = line[:1]
+        
+        if first.isdigit():
+            # Sub-sections (x.y format) - checked first as the more specific form
+            match = _SUBSECTION_RE.match(line)
+            if match:
+                markdown_content.append(f"### {match.group(1)}. {match.group(2)}")
+                markdown_content.append("")
+                i += 1
+                continue
+            
+            # Main numbered sections
+            match = _SECTION_RE.match(line)
+            if match:
+                markdown_content.append(f"## {match.group(1)}. {match.group(2)}")
+                markdown_content.append("")
+                i += 1
+                continue
+            
+            # Numbered list items
+            if _NUM_LIST_RE.match(line):
+                markdown_content.append(line)
+                i += 1
+                continue
+        
+        elif first.isupper():
+            # Status and Date
+            if line.startswith(("Status:", "Date:")):
+                markdown_content.append(f"**{line}**")
+                markdown_content.append("")
+                i += 1
+                continue
+            
+            # Keywords that should be headers
+            keywords = _HEADER_BY_FIRST.get(first)
+            if keywords and line.startswith(keywords):
+                markdown_content.append(f"### {line}")
+                markdown_content.append("")
+                i += 1
+                continue
+            
+            # Check for technical labels
+            if _TECH_LABEL_RE.match(line) and len(line) < 50:
+                markdown_content.append(f"#### {line}")
+                markdown_content.append("")
+                i += 1
+                continue
+        
+        # Check for list items
+        elif line.startswith(("- ", "• ")) or _ALPHA_LIST_RE.match(line):
+            markdown_content.append(line)
+            i += 1
+            continue
+        
+        # Check for sequence diagram content
+        if _SEQ_START_RE.search(line):
+            
+            # Start collecting sequence diagram
+            is_diagram_start = "sequenceDiagram" in line
+            if is_diagram_start:
+                markdown_content.append("```mermaid")
+            
+            markdown_content.append(line)
+            
+            # Look ahead to see if more sequence diagram content follows
+            j = i + 1
+            while j < len(lines) and _SEQ_LINE_RE.search(lines[j]):
+                markdown_content.append(lines[j])
+                j += 1
+            
+            if is_diagram_start:
+                markdown_content.append("```")
+                markdown_content.append("")
+            
+            i = j - 1
+        
+        # Regular paragraphs
+        else:
+            markdown_content.append(line)
+            markdown_content.append("")
+        
+        i += 1
+    
+    return '\n'.join(markdown_content)
 
-def create_structured_markdown(text):
-    """Convert the extracted text to well-structured markdown"""
+def _replace_spans(content, start_anchor, end_anchor, replacement):
+    """Replace every span running from start_anchor through end_anchor"""
+    
+    parts = []
+    pos = 0
+    while True:
+        start = content.find(start_anchor, pos)
+        if start == -1:
+            break
+        end = content.find(end_anchor, start + len(start_anchor))
+        if end == -1:
+            break
+        parts.append(content[pos:start])
+        parts.append(replacement)
+        pos = end + len(end_anchor)
+    
+    if not parts:
+        return content
+    parts.append(content[pos:])
+    return "".join(parts)
+
+def manual_content_fixes(content):
+    """Apply manual fixes for known content issues"""
+    
+    # Split large paragraphs and add proper structure. Each fix replaces the
+    # text from a start anchor up to and including the nearest end anchor.
+    fixes = [
+        # Fix authentication section
+        ('Authentication: Design a secure OIDC-based', 'publisher groups.',
+         '''#### Authentication:
+Design a secure OIDC-based passwordless authentication system managed by Moneta Core, using AWS Cognito, Lambda, DynamoDB, and API Gateway. Common flows involve users clicking a "Login with Moneta mPass" button on Publisher sites/apps, redirecting to Moneta Core's hosted UI, authenticating via their mPass mobile app (QR scan, OTP), and then being redirected back to the Publisher with OIDC tokens. The system must support session management, token revocation, refresh tokens, and SSO for publisher groups.'''),
+        
+        # Fix identification section
+        ('Identification: The current UUIDv4 identifiers', 'and security.',
+         '''#### Identification:
+The current UUIDv4 identifiers for MOs, Publishers, and mPasses (MO UUID + User UUID) are not human-friendly. A new coding/alias scheme is needed, supporting global scale, high availability, performance, and security.'''),
+    ]
     
-    # Start with the proper title
-    markdown = """# ADR-015: Moneta Network Authentication and Identification
+    for start_anchor, end_anchor, replacement in fixes:
+        content = _replace_spans(content, start_anchor, end_anchor, replacement)
+    
+    # Clean up excessive whitespace
+    content = _WS_COLLAPSE_RE.sub('\n\n', content)
+    
+    return content
+
+# Hand-structured markdown for ADR-015, starting with the proper title
+_TEMPLATE_MARKDOWN = """# ADR-015: Moneta Network Authentication and Identification
 
 **Status:** Proposed  
 **Date:** 2025-06-01
@@ -309,38 +577,90 @@ Ensuring correct application of policies based on tiers and family billing accou
 *[This is a partial conversion - the document contains additional sections on Technical Details, Security Assessment, Open Issues, and Story Definitions that would continue with the same level of detail and structure]*
 
 """
+
+def create_structured_markdown():
+    """Return the well-structured markdown for the ADR"""
     
-    return markdown
+    return _TEMPLATE_MARKDOWN
 
-def main():
-    """Main conversion function"""
+def write_markdown(raw_text, output_path, mode='structured'):
+    """Write markdown for extracted text to output_path, returning the output size"""
     
-    pdf_file = "docs/adr/MoPrd-ADR-015_ Moneta Network Authentication and Identification-300625-052159.pdf"
-    output_file = "docs/adr/ADR-015_MonetaNetworkAuthentication.md"
+    if mode == 'preserve':
+        print("Creating structured markdown...")
+        markdown_content = create_structured_markdown()
+    else:
+        print("Cleaning and structuring text...")
+        lines = clean_and_structure_text(raw_text)
+        
+        print("Converting to markdown...")
+        markdown_content = format_as_proper_markdown(lines)
+        
+        print("Applying manual fixes...")
+        markdown_content = manual_content_fixes(markdown_content)
     
-    if not os.path.exists(pdf_file):
-        print(f"Error: PDF file not found: {pdf_file}")
-        sys.exit(1)
+    # Write to file with a 1 MB buffer and no newline translation
+    with open(output_path, 'w', encoding='utf-8', buffering=1 << 20, newline='\n') as f:
+        f.write(markdown_content)
     
+    return len(markdown_content)
+
+class PdfOpenError(Exception):
+    """Raised by convert when the input document cannot be opened"""
+
+def convert(pdf_path, output_path, mode='structured'):
+    """Convert a PDF to markdown, returning the output size or None if no text was found"""
+    
+    if mode not in MODES:
+        raise ValueError(f"Unknown conversion mode: {mode}")
+    
+    # Only extraction opens the input; output errors surface on their own
     print("Extracting text from PDF...")
-    raw_text = extract_text_preserve_structure(pdf_file)
+    try:
+        raw_text = extract(pdf_path, _PAGE_SEPARATORS[mode])
+    except (FileNotFoundError, pymupdf.FileNotFoundError, pymupdf.FileDataError) as e:
+        raise PdfOpenError(f"cannot open PDF file {pdf_path}: {e}") from e
     
     if not raw_text.strip():
-        print("No content extracted from PDF.")
+        return None
+    
+    return write_markdown(raw_text, output_path, mode)
+
+def main():
+    """Main conversion function"""
+    
+    parser = argparse.ArgumentParser(description="Convert an ADR PDF to markdown")
+    parser.add_argument(
+        "--mode", choices=MODES, default="structured",
+        help="structured: format the extracted text; preserve: emit the structured template"
+    )
+    parser.add_argument(
+        "pdf_file", nargs="?",
+        default="docs/adr/MoPrd-ADR-015_ Moneta Network Authentication and Identification-300625-052159.pdf"
+    )
+    parser.add_argument(
+        "output_file", nargs="?",
+        default="docs/adr/ADR-015_MonetaNetworkAuthentication.md"
+    )
+    args = parser.parse_args()
+    
+    try:
+        size = convert(args.pdf_file, args.output_file, args.mode)
+    except PdfOpenError as e:
+        print(f"Error: {e}")
         sys.exit(1)
     
-    print("Creating structured markdown...")
-    markdown_content = create_structured_markdown(raw_text)
+    if size is None:
+        print("No content extracted from PDF.")
+        sys.exit(1)
     
-    # Write to file
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(markdown_content)
+    print(f"Successfully converted PDF to markdown: {args.output_file}")
+    print(f"Output file size: {size} characters")
     
-    print(f"Successfully converted PDF to markdown: {output_file}")
-    print(f"Output file size: {len(markdown_content)} characters")
-    print("\nNote: This is a structured template based on the PDF content.")
-    print("The full technical details, sequence diagrams, and user stories")
-    print("sections would need to be completed with the remaining content.")
+    if args.mode == 'preserve':
+        print("\nNote: This is a structured template based on the PDF content.")
+        print("The full technical details, sequence diagrams, and user stories")
+        print("sections would need to be completed with the remaining content.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()